@@ -1,28 +1,117 @@
 # your code goes here
 
+import numpy as np
+from collections import Counter
+
+try:
+	from numba import njit, prange, types
+	from numba.typed import Dict
+	HAVE_NUMBA = True
+except ImportError:
+	HAVE_NUMBA = False
+
+try:
+	# AOT Cython kernel, no JIT warmup (see pfx_count.pyx)
+	from pfx_count import count_subarrays as _count_subarrays_c
+	HAVE_CYTHON = True
+except ImportError:
+	HAVE_CYTHON = False
+
+# arrays below this stay on the serial accumulate; thread launch costs more
+# than the scan itself
+_PAR_SCAN_MIN = 1 << 20
+_PAR_SCAN_CHUNK = 1 << 18
+
+if HAVE_NUMBA:
+	@njit(parallel=True, cache=True)
+	def _parallel_cumsum(arr, chunk):
+		# Two-phase Blelloch-style scan: local cumsums per chunk, small
+		# serial exclusive scan over chunk totals, then broadcast add
+		n = arr.size
+		n_chunks = (n + chunk - 1) // chunk
+		chunk_sums = np.empty(n_chunks, dtype=np.int64)
+		for c in prange(n_chunks):
+			start = c * chunk
+			end = min(start + chunk, n)
+			s = 0
+			for i in range(start, end):
+				s += arr[i]
+				arr[i] = s
+			chunk_sums[c] = s
+		offset = 0
+		for c in range(n_chunks):
+			t = chunk_sums[c]
+			chunk_sums[c] = offset
+			offset += t
+		for c in prange(n_chunks):
+			start = c * chunk
+			end = min(start + chunk, n)
+			off = chunk_sums[c]
+			if off != 0:
+				for i in range(start, end):
+					arr[i] += off
+		return arr
+
+
 def pfx(arr, n):
-	pfx_dict = {}
-	pfx_sum = [0]*(n)
-	pfx_sum[0] = arr[0]
-	for i in range(1, n):
-		pfx_sum[i] = pfx_sum[i-1]+arr[i]
-		
-	for n in pfx_sum:
-		pfx_dict[n] = pfx_dict.get(n, 0)+1
-		
+	# In-place accumulate reuses the int64 buffer instead of allocating a
+	# second array for the scan output
+	pfx_sum = np.array(arr, dtype=np.int64)
+	if HAVE_NUMBA and pfx_sum.size >= _PAR_SCAN_MIN:
+		_parallel_cumsum(pfx_sum, _PAR_SCAN_CHUNK)
+	else:
+		np.add.accumulate(pfx_sum, out=pfx_sum)
+	pfx_dict = Counter(pfx_sum.tolist())
+
 	return pfx_sum, pfx_dict
-	
+
+
+if HAVE_NUMBA:
+	@njit(cache=True)
+	def _count_subarrays(arr, k):
+		seen = Dict.empty(key_type=types.int64, value_type=types.int64)
+		seen[0] = 1
+		s = 0
+		count = 0
+		for x in arr:
+			s += x
+			j = s-k
+			if j in seen:
+				count += seen[j]
+			if s in seen:
+				seen[s] += 1
+			else:
+				seen[s] = 1
+		return count
+else:
+	def _count_subarrays(arr, k):
+		seen = {0: 1}
+		_get = seen.get
+		s = 0
+		count = 0
+		for x in arr:
+			s += x
+			count += _get(s-k, 0)
+			seen[s] = _get(s, 0)+1
+		return count
+
 
 def func(arr, n, k):
-	pfx_sum, pfx_dict = pfx(arr, n)
-	
-	count = 0
-	
-	for i in range(n):
-		j = pfx_sum[i]-k
-		count += pfx_dict.get(j, 0)
-		
-	return count
-	
-	
-print(func([1, 0, 1, 2, 10, 5], 6, 3))
\ No newline at end of file
+	a = np.asarray(arr, dtype=np.int64)
+	if HAVE_CYTHON:
+		return int(_count_subarrays_c(a, k))
+	return int(_count_subarrays(a, k))
+
+
+def func_sorted(arr, n, k):
+	# Hash-free alternative for non-negative arr and k > 0: count matches
+	# against the sorted prefix sums with two bulk binary searches.
+	ps = np.cumsum(np.asarray(arr, dtype=np.int64))
+	s = np.sort(np.concatenate((np.zeros(1, dtype=np.int64), ps)))
+	targets = ps - k
+	lo = np.searchsorted(s, targets, 'left')
+	hi = np.searchsorted(s, targets, 'right')
+	return int((hi-lo).sum())
+
+
+print(func([1, 0, 1, 2, 10, 5], 6, 3))
@@ -1,73 +1,91 @@
 import pandas as pd
 import numpy as np
-import random
+import pyarrow as pa
+import pyarrow.csv as pcsv
 import string
-from datetime import datetime, timedelta
+from datetime import datetime
 
 # Config
 N_ROWS = 100
 OUTPUT_FILE = "messy_data.csv"
-np.random.seed(42)
-random.seed(42)
+rng = np.random.default_rng(42)
 
-def random_date(start, end):
-    """Generate a random datetime between two datetime objects."""
-    return start + timedelta(
-        seconds=random.randint(0, int((end - start).total_seconds()))
-    )
+def random_dates(start, end, size):
+    """Generate `size` random YYYY-MM-DD date strings between two datetimes."""
+    start_s = int(start.timestamp())
+    end_s = int(end.timestamp())
+    secs = rng.integers(start_s, end_s + 1, size=size)
+    # strftime on the DatetimeIndex parses the format string once for the whole array
+    return pd.to_datetime(secs, unit="s").strftime("%Y-%m-%d").values
 
-def random_string(n=8):
-    return ''.join(random.choices(string.ascii_letters + string.digits, k=n))
+ALPHABET = np.frombuffer((string.ascii_letters + string.digits).encode(), dtype="S1")
 
-def introduce_error(val, error_rate=0.05):
-    """Inject random anomalies."""
-    if pd.isna(val):  # already NaN
-        return val
-    if random.random() < error_rate:
-        choice = random.choice([
-            None,                              # missing
-            "",                                # blank
-            "??",                              # nonsense
-            f"{val},{val}",                    # multiple values in one cell
-            random_string(5),                  # random junk
-            str(val) + " " + random_string(3), # value + garbage
-            -9999,                             # absurd negative
-            9999999999                         # absurd large
-        ])
-        return choice
-    return val
+def random_strings(n, size):
+    """Generate `size` random alphanumeric strings of length `n` in one shot."""
+    chars = rng.choice(ALPHABET, size=(size, n))
+    return chars.view(f"S{n}").ravel().astype(str)
 
-# Pre-generate some lookup data
-products = ["Laptop", "Shoes", "Phone", "TV", "Shirt", "Headphones"]
-categories = ["Electronics", "Apparel", "Home", "Sports"]
-regions = ["NA", "APAC", "EMEA", "LATAM"]
-payment_methods = ["Credit Card", "UPI", "PayPal", "NetBanking", "COD"]
-shipping_modes = ["Standard", "Express", "Same-day"]
+def introduce_errors(df, error_rate=0.05):
+    """Inject random anomalies into a DataFrame, column by column."""
+    mask = rng.random(df.shape) < error_rate
+    mask &= df.notna().to_numpy()  # leave already-missing cells alone, one check for the whole frame
+    for j, col in enumerate(df.columns):
+        col_mask = mask[:, j]
+        n_bad = int(col_mask.sum())
+        if n_bad == 0:
+            continue
+        vals = df[col].to_numpy(dtype=object, copy=True)
+        originals = vals[col_mask]
+        kinds = rng.integers(0, 8, size=n_bad)
+        replacements = np.empty(n_bad, dtype=object)
+        replacements[kinds == 0] = None                            # missing
+        replacements[kinds == 1] = ""                              # blank
+        replacements[kinds == 2] = "??"                            # nonsense
+        dup = kinds == 3                                           # multiple values in one cell
+        replacements[dup] = [f"{v},{v}" for v in originals[dup]]
+        junk = kinds == 4                                          # random junk
+        replacements[junk] = random_strings(5, int(junk.sum()))
+        garbage = kinds == 5                                       # value + garbage
+        replacements[garbage] = [f"{v} {g}" for v, g in
+                                 zip(originals[garbage], random_strings(3, int(garbage.sum())))]
+        replacements[kinds == 6] = -9999                           # absurd negative
+        replacements[kinds == 7] = 9999999999                      # absurd large
+        vals[col_mask] = replacements
+        df[col] = vals
+    return df
+
+# Pre-generate some lookup data (typed arrays so column builds skip dtype inference)
+products = np.array(["Laptop", "Shoes", "Phone", "TV", "Shirt", "Headphones"])
+categories = np.array(["Electronics", "Apparel", "Home", "Sports"])
+regions = np.array(["NA", "APAC", "EMEA", "LATAM"])
+payment_methods = np.array(["Credit Card", "UPI", "PayPal", "NetBanking", "COD"])
+shipping_modes = np.array(["Standard", "Express", "Same-day"])
+genders = np.array(["M", "F", "Other"])
+brands = np.array(["BrandA", "BrandB", "BrandC", "BrandX"])
+statuses = np.array(["Success", "Failed", "Pending"])
 
 # Generate base data
 df = pd.DataFrame({
     "order_id": np.arange(1, N_ROWS + 1),
-    "order_date": [random_date(datetime(2020,1,1), datetime(2023,12,31)).strftime("%Y-%m-%d")
-                   for _ in range(N_ROWS)],
-    "customer_id": np.random.randint(1000, 9999, size=N_ROWS),
-    "customer_name": [random_string(6) for _ in range(N_ROWS)],
-    "email": [f"user{idx}@example.com" for idx in range(N_ROWS)],
-    "phone": [f"+91{random.randint(6000000000,9999999999)}" for _ in range(N_ROWS)],
-    "gender": np.random.choice(["M", "F", "Other"], size=N_ROWS),
-    "dob": [random_date(datetime(1960,1,1), datetime(2005,12,31)).strftime("%Y-%m-%d")
-            for _ in range(N_ROWS)],
-    "product_id": np.random.randint(100, 999, size=N_ROWS),
-    "product_name": np.random.choice(products, size=N_ROWS),
-    "category": np.random.choice(categories, size=N_ROWS),
-    "brand": np.random.choice(["BrandA", "BrandB", "BrandC", "BrandX"], size=N_ROWS),
-    "store_id": np.random.randint(1, 100, size=N_ROWS),
-    "region": np.random.choice(regions, size=N_ROWS),
-    "payment_method": np.random.choice(payment_methods, size=N_ROWS),
-    "transaction_status": np.random.choice(["Success", "Failed", "Pending"], size=N_ROWS),
-    "shipping_mode": np.random.choice(shipping_modes, size=N_ROWS),
-    "quantity": np.random.randint(1, 5, size=N_ROWS),
-    "unit_price": np.round(np.random.uniform(10, 5000, size=N_ROWS), 2),
-    "discount": np.round(np.random.uniform(0, 0.5, size=N_ROWS), 2),
+    "order_date": random_dates(datetime(2020,1,1), datetime(2023,12,31), N_ROWS),
+    "customer_id": rng.integers(1000, 10000, size=N_ROWS),
+    "customer_name": random_strings(6, N_ROWS),
+    "email": np.char.add(np.char.add("user", np.arange(N_ROWS).astype(str)), "@example.com"),
+    "phone": np.char.add("+91", rng.integers(6000000000, 10000000000, size=N_ROWS).astype(str)),
+    "gender": rng.choice(genders, size=N_ROWS),
+    "dob": random_dates(datetime(1960,1,1), datetime(2005,12,31), N_ROWS),
+    "product_id": rng.integers(100, 1000, size=N_ROWS),
+    "product_name": rng.choice(products, size=N_ROWS),
+    "category": rng.choice(categories, size=N_ROWS),
+    "brand": rng.choice(brands, size=N_ROWS),
+    "store_id": rng.integers(1, 100, size=N_ROWS),
+    "region": rng.choice(regions, size=N_ROWS),
+    "payment_method": rng.choice(payment_methods, size=N_ROWS),
+    "transaction_status": rng.choice(statuses, size=N_ROWS),
+    "shipping_mode": rng.choice(shipping_modes, size=N_ROWS),
+    "quantity": rng.integers(1, 5, size=N_ROWS),
+    "unit_price": np.round(rng.uniform(10, 5000, size=N_ROWS), 2),
+    "discount": np.round(rng.uniform(0, 0.5, size=N_ROWS), 2),
 })
 
 # Derived columns
@@ -75,15 +93,21 @@ df["total_amount"] = np.round(df["quantity"] * df["unit_price"] * (1 - df["disco
 
 # Add filler columns to reach ~50
 for i in range(21, 51):
-    df[f"col_{i}"] = [random.choice([
-        random_string(5), random.randint(1, 9999),
-        None, "", "N/A"
-    ]) for _ in range(N_ROWS)]
+    candidates = np.empty((5, N_ROWS), dtype=object)
+    candidates[0] = random_strings(5, N_ROWS)
+    candidates[1] = rng.integers(1, 9999, size=N_ROWS)
+    candidates[2] = None
+    candidates[3] = ""
+    candidates[4] = "N/A"
+    pick = rng.integers(0, 5, size=N_ROWS)
+    df[f"col_{i}"] = candidates[pick, np.arange(N_ROWS)]
 
 # Inject anomalies into random sample
-for col in df.columns:
-    df[col] = df[col].apply(lambda x: introduce_error(x, error_rate=0.03))
+df = introduce_errors(df, error_rate=0.03)
 
-# Save to CSV
-df.to_csv(OUTPUT_FILE, index=False)
+# Save to CSV via pyarrow's multithreaded C++ writer
+for col in df.columns:
+    if df[col].dtype == object:  # mixed-type columns confuse arrow's inference
+        df[col] = df[col].astype(str).where(df[col].notna(), None)
+pcsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), OUTPUT_FILE)
 print(f"Generated {N_ROWS} rows of messy data in {OUTPUT_FILE}")
@@ -0,0 +1,25 @@
+# cython: boundscheck=False, wraparound=False
+# AOT-compiled fused subarray-sum=k counter. Build in place with:
+#   cythonize -i pfx_count.pyx
+
+from cpython.dict cimport PyDict_GetItem, PyDict_SetItem
+from cpython.ref cimport PyObject
+
+
+cpdef long long count_subarrays(long long[::1] arr, long long k):
+    cdef dict seen = {0: 1}
+    cdef long long s = 0
+    cdef long long count = 0
+    cdef Py_ssize_t i
+    cdef PyObject* hit
+    for i in range(arr.shape[0]):
+        s += arr[i]
+        hit = PyDict_GetItem(seen, s - k)
+        if hit is not NULL:
+            count += <long long>(<object>hit)
+        hit = PyDict_GetItem(seen, s)
+        if hit is not NULL:
+            PyDict_SetItem(seen, s, <long long>(<object>hit) + 1)
+        else:
+            PyDict_SetItem(seen, s, 1)
+    return count
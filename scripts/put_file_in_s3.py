@@ -1,12 +1,41 @@
 import boto3
 import json
+from boto3.s3.transfer import TransferConfig
+
+try:
+    # aws-crt S3 client (pip install 'boto3[crt]') does multi-stream uploads at line rate
+    import botocore.session
+    from s3transfer.crt import BotocoreCRTRequestSerializer, CRTTransferManager, create_s3_crt_client
+    HAVE_CRT = True
+except ImportError:
+    HAVE_CRT = False
+
+# Split larger files into parallel multipart uploads
+transfer_config = TransferConfig(
+    multipart_threshold=8*1024*1024,
+    multipart_chunksize=8*1024*1024,
+    max_concurrency=16,
+    use_threads=True,
+)
+
+# One client per process: reuses botocore's pooled TLS connections across calls
+_S3 = boto3.client("s3")
 
 def upload_to_s3():
-    s3_client = boto3.client("s3")
     bucket_name = "airflow-etl-project-bucket-456321"
     bucket_key = "airflow_etl_project/input/"
     s3_file_name = "order_status.csv"
 
-    s3_client.upload_file("lookup/order_status.csv", bucket_name, bucket_key+s3_file_name)
-    
-upload_to_s3()
\ No newline at end of file
+    if HAVE_CRT:
+        crt_client = create_s3_crt_client(region="us-east-1", target_throughput_gbps=10)
+        serializer = BotocoreCRTRequestSerializer(botocore.session.Session())
+        with CRTTransferManager(crt_client, serializer) as manager:
+            future = manager.upload("lookup/order_status.csv", bucket_name, bucket_key+s3_file_name)
+            future.result()
+    else:
+        # Stream from an open handle so disk reads overlap the multipart sends
+        with open("lookup/order_status.csv", "rb") as f:
+            _S3.upload_fileobj(f, bucket_name, bucket_key+s3_file_name, Config=transfer_config)
+
+if __name__ == "__main__":
+    upload_to_s3()
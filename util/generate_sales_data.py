@@ -1,22 +1,178 @@
+import argparse
 import pandas as pd
 import numpy as np
+import os
 import random
-import uuid
 from datetime import datetime, timedelta
 import time
-import gc
-from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 import itertools
 
-# Set random seed for reproducibility
-np.random.seed(42)
+# Seed for the random module (only used by legacy helpers); the generator
+# itself draws from a single np.random.Generator created in __init__
 random.seed(42)
 
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+    prange = range  # plain loop in the interpreted fallback
+
+try:
+    # arrow's C++ CSV writer formats columnar buffers with multithreading;
+    # one CSVWriter per file also avoids reopening in append mode per batch
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    import pyarrow.parquet as pq
+    HAVE_PYARROW = True
+except ImportError:
+    HAVE_PYARROW = False
+
+try:
+    # polars' CSV writer serializes columns in parallel, several times
+    # faster than pandas' single-threaded to_csv on wide frames
+    import polars as pl
+    HAVE_POLARS = True
+except ImportError:
+    HAVE_POLARS = False
+
+try:
+    import psutil
+    HAVE_PSUTIL = True
+except ImportError:
+    HAVE_PSUTIL = False
+
+_HEX_LUT = np.array([format(i, '02x') for i in range(256)])
+
+
+def _assign_mess_codes(gate, r1, r2, general_type, col_kind):
+    """Decide which mess type each cell gets, entirely on numeric arrays.
+
+    col_kind: 0 generic, 1 email, 2 phone, 3 age, 4 quantity, 5 price.
+    Returns int8 codes: -1 untouched, 0-6 the general mess types,
+    10/11 the first/second column-specific branch.
+    """
+    n = gate.size
+    out = np.full(n, -1, dtype=np.int8)
+    # Rows are independent, so prange shards the batch across cores and
+    # LLVM vectorizes the float threshold compares within each shard
+    for i in prange(n):
+        if not gate[i]:
+            continue
+        if col_kind == 1:    # email
+            if r1[i] < 0.3:
+                out[i] = 10
+                continue
+            if r2[i] < 0.2:
+                out[i] = 11
+                continue
+        elif col_kind == 2:  # phone
+            if r1[i] < 0.25:
+                out[i] = 10
+                continue
+            if r2[i] < 0.2:
+                out[i] = 11
+                continue
+        elif col_kind == 3:  # age
+            if r1[i] < 0.15:
+                out[i] = 10
+                continue
+        elif col_kind == 4:  # quantity
+            if r1[i] < 0.08:
+                out[i] = 10
+                continue
+        elif col_kind == 5:  # price/cost/amount
+            if r1[i] < 0.05:
+                out[i] = 10
+                continue
+            if r2[i] < 0.03:
+                out[i] = 11
+                continue
+        out[i] = general_type[i]
+    return out
+
+
+if HAVE_NUMBA:
+    _assign_mess_codes = njit(parallel=True, fastmath=True, cache=True)(_assign_mess_codes)
+
+def batch_uuid4_strings(n):
+    """Generate n uuid4 strings from a single urandom read, no UUID objects"""
+    raw = np.frombuffer(os.urandom(16*n), dtype=np.uint8).reshape(n, 16).copy()
+    raw[:, 6] = (raw[:, 6] & 0x0f) | 0x40  # version 4
+    raw[:, 8] = (raw[:, 8] & 0x3f) | 0x80  # RFC 4122 variant
+    hx = _HEX_LUT[raw]
+    out = hx[:, 0]
+    for j in range(1, 16):
+        if j in (4, 6, 8, 10):  # 8-4-4-4-12 grouping
+            out = np.char.add(out, '-')
+        out = np.char.add(out, hx[:, j])
+    return out.astype(object)
+
+
+# Long-lived generator held by each pool worker (see _init_worker)
+_worker_gen = None
+
+
+def _init_worker(gen):
+    """Pool initializer: deserialize the generator once per worker.
+
+    Each worker keeps the instance for its lifetime, so the scratch
+    buffers genuinely persist across the batches that worker handles
+    instead of starting cold from a per-task pickle. The numba kernel is
+    warmed here too - inside the worker, never in the parent before the
+    fork (the parallel threading layers are not fork-safe).
+    """
+    global _worker_gen
+    _worker_gen = gen
+    if HAVE_NUMBA:
+        _assign_mess_codes(np.zeros(1, dtype=bool), np.zeros(1),
+                           np.zeros(1), np.zeros(1, dtype=np.int8), 0)
+
+
+def _worker_batch(batch_start, batch_size, seed):
+    """Pool task: run one batch on the worker's long-lived generator."""
+    return _worker_gen.generate_batch_data(batch_start, batch_size, seed)
+
+
 class MessyEcommerceGenerator:
-    def __init__(self, total_rows=1000):
+    # Number of columns run through messy_column per batch; sized the
+    # per-batch probability matrix drawn in generate_batch_data
+    _N_MESSY_COLS = 14
+
+    # Rough in-memory bytes per generated row, for the batch-size heuristic
+    # (matches the ~0.9 KB/row file-size estimate printed after a run)
+    _EST_ROW_BYTES = 900
+
+    def __init__(self, total_rows=1000, batch_size=None):
         self.total_rows = total_rows
-        self.batch_size = 500  # Process in batches for memory efficiency
-        
+        if batch_size is None:
+            # Larger batches amortize the fixed per-batch costs (DataFrame
+            # build, writer call, worker dispatch); cap at a slice of
+            # available memory divided across the parallel workers
+            if HAVE_PSUTIL:
+                avail = psutil.virtual_memory().available
+                batch_size = int(avail * 0.1 / (self._EST_ROW_BYTES * max(1, os.cpu_count())))
+            else:
+                batch_size = 50_000
+            batch_size = max(500, min(batch_size, 200_000, total_rows))
+        self.batch_size = batch_size  # Process in batches for memory efficiency
+
+        # One PCG64 Generator for everything: faster than the legacy
+        # RandomState and keeps all reproducibility in a single stream
+        self.rng = np.random.default_rng(42)
+
+        # No kernel warm-up here: running a numba parallel region in the
+        # parent before the batch pool forks leaves the threading layer in
+        # a non-fork-safe state (deadlocks or BrokenProcessPool depending
+        # on the layer). _init_worker warms it inside each worker instead.
+
+        # Scratch object buffers recycled across the batches a worker
+        # runs on its long-lived copy of this instance (see _scratch)
+        self._scratch_bufs = {}
+
+
         # Setup all lookup data
         self.setup_customers()
         self.setup_products()
@@ -64,6 +220,16 @@ class MessyEcommerceGenerator:
             for zip_code in zip_codes:
                 self.valid_zips[zip_code] = {'city': city, 'state': state}
         
+        # CSR-style ZIP pool: one flat array plus offsets per (city, state)
+        # code, so a whole batch samples ZIPs in a single broadcast draw
+        zip_lists = [self.city_zip_mapping[cs] for cs in self.cities_states]
+        self._zip_flat = np.array(list(itertools.chain.from_iterable(zip_lists)), dtype=object)
+        self._zip_offsets = np.concatenate(([0], np.cumsum([len(z) for z in zip_lists])))
+
+        # City/state arrays aligned with self.cities_states, built once
+        self._cities_arr = np.array([c for c, s in self.cities_states], dtype=object)
+        self._states_arr = np.array([s for c, s in self.cities_states], dtype=object)
+
         print(f"Created geography mapping with {len(self.valid_zips)} real ZIP codes")
     
     def get_zip_for_city_state(self, city, state):
@@ -122,51 +288,67 @@ class MessyEcommerceGenerator:
             'Green', 'Adams', 'Nelson', 'Baker', 'Hall', 'Rivera', 'Campbell', 'Mitchell', 'Carter', 'Roberts'
         ]
         
-        # Generate all 2,500 combinations
-        self.customers = {}
-        customer_num = 1
-        
-        def generate_phone_num():
-            area = random.randint(200, 999)
-            exchange = random.randint(200, 999)
-            number = random.randint(1000, 9999)
-            formats = [
-                f"({area}) {exchange}-{number}",
-                f"{area}-{exchange}-{number}",
-                f"{area}.{exchange}.{number}",
-                f"+1{area}{exchange}{number}",
-                f"{area}{exchange}{number}"
-            ]
-            
-            return random.choice(formats)
-        
+        # Generate all 2,500 combinations, indexed by position - hashing
+        # UUID objects per lookup is slower than plain list indexing
+        self.customers = []
+        n_cust = len(first_names) * len(last_names)
+
+        # Phone numbers in bulk: draw every part for every customer at once,
+        # then format each with a randomly picked template
+        areas = self.rng.integers(200, 1000, size=n_cust)
+        exchanges = self.rng.integers(200, 1000, size=n_cust)
+        numbers = self.rng.integers(1000, 10000, size=n_cust)
+        fmt_pick = self.rng.integers(0, 5, size=n_cust)
+        phone_formats = [
+            "({a}) {e}-{n}",
+            "{a}-{e}-{n}",
+            "{a}.{e}.{n}",
+            "+1{a}{e}{n}",
+            "{a}{e}{n}",
+        ]
+        phones = [phone_formats[f].format(a=a, e=e, n=n)
+                  for f, a, e, n in zip(fmt_pick, areas, exchanges, numbers)]
+
+        ages = self.rng.integers(18, 81, size=n_cust)
+        genders = self.rng.choice(['M', 'F', 'Other'], size=n_cust)
+
+        customer_num = 0
         for first_name in first_names:
             for last_name in last_names:
-                customer_id = uuid.uuid4()
                 full_name = f"{first_name} {last_name}"
-                self.customers[customer_id] = {
+                self.customers.append({
                     'full_name': full_name,
                     'first_name': first_name,
                     'last_name': last_name,
                     'email': f"{first_name.lower()}.{last_name.lower()}@gmail.com",
-                    'phone': generate_phone_num(),
-                    'age' : random.randint(18, 80),
-                    "gender": random.choice(['M', 'F', 'Other'])
-                }
+                    'phone': phones[customer_num],
+                    'age' : int(ages[customer_num]),
+                    "gender": str(genders[customer_num])
+                })
                 customer_num += 1
-        
-        # Create weighted customer selection for realistic repeat behavior
-        customer_ids = list(self.customers.keys())
-        
+
+        # SoA mirrors of the customer table: one array per attribute, so a
+        # batch of integer indices gathers a whole column in one C call.
+        # The exposed customer_id strings are pre-generated once in bulk.
+        self._cust_ids = batch_uuid4_strings(n_cust)
+        self._cust_email = np.array([c['email'] for c in self.customers], dtype=object)
+        self._cust_first = np.array([c['first_name'] for c in self.customers], dtype=object)
+        self._cust_last = np.array([c['last_name'] for c in self.customers], dtype=object)
+        self._cust_phone = np.array([c['phone'] for c in self.customers], dtype=object)
+        self._cust_age = np.array([c['age'] for c in self.customers], dtype=np.int16)
+        self._cust_gender = np.array([c['gender'] for c in self.customers], dtype=object)
+
+        # Weighted customer selection for realistic repeat behavior:
         # 20% of customers are heavy buyers (5-15 orders)
-        # 30% are moderate buyers (2-5 orders)  
+        # 30% are moderate buyers (2-5 orders)
         # 50% are light buyers (1-2 orders)
-        heavy_buyers = customer_ids[:500]  # First 500 customers
-        moderate_buyers = customer_ids[500:1250]  # Next 750 customers
-        light_buyers = customer_ids[1250:]  # Remaining 1250 customers
-        
-        # Create weighted list for selection
-        self.weighted_customers = (heavy_buyers * 8 + moderate_buyers * 3 + light_buyers * 1)
+        # A probability vector over the 2,500 customers replaces the old
+        # materialized 16,250-element weighted list
+        self._cust_p = np.empty(len(self.customers))
+        self._cust_p[:500] = 8       # heavy buyers
+        self._cust_p[500:1250] = 3   # moderate buyers
+        self._cust_p[1250:] = 1      # light buyers
+        self._cust_p /= self._cust_p.sum()
         
         print(f"Created {len(self.customers)} unique customers with weighted distribution")
     
@@ -208,44 +390,66 @@ class MessyEcommerceGenerator:
             }
         }
         
-        self.products = {}
-        product_num = 1
-        
+        # One row per (category, subcategory) group, then draw every product
+        # attribute in bulk - no per-product Python loop or scalar rng calls
+        group_category = []
+        group_subcat = []
+        group_brands = []
+        group_lo = []
+        group_hi = []
         for category, cat_data in categories.items():
             for subcategory in cat_data['subcategories']:
-                # Generate 8-12 products per subcategory
-                num_products = random.randint(8, 12)
-                
-                for i in range(num_products):
-                    product_id = f"PRD_{product_num:03d}"
-                    brand = random.choice(cat_data['brands'])
-                    
-                    # Generate product name
-                    if category == 'Electronics':
-                        product_name = f"{brand} {subcategory.rstrip('s')} {random.choice(['Pro', 'Max', 'Ultra', 'Plus', 'Mini', ''])}"
-                    else:
-                        product_name = f"{brand} {subcategory.rstrip('s')} {random.choice(['Premium', 'Classic', 'Sport', 'Deluxe', ''])}"
-                    
-                    product_name = product_name.strip()
-                    
-                    # Generate realistic prices
-                    min_price, max_price = cat_data['price_range']
-                    list_price = round(random.uniform(min_price, max_price), 2)
-                    cost_price = round(list_price * random.uniform(0.4, 0.8), 2)  # Cost is 40-80% of list price
-                    
-                    self.products[product_id] = {
-                        'name': product_name,
-                        'category': category,
-                        'subcategory': subcategory,
-                        'brand': brand,
-                        'list_price': list_price,
-                        'cost': cost_price
-                    }
-                    
-                    product_num += 1
-        
-        print(f"Created {len(self.products)} products across 5 categories")
-    
+                group_category.append(category)
+                group_subcat.append(subcategory)
+                group_brands.append(np.array(cat_data['brands']))
+                lo, hi = cat_data['price_range']
+                group_lo.append(lo)
+                group_hi.append(hi)
+
+        # Generate 8-12 products per subcategory
+        counts = self.rng.integers(8, 13, size=len(group_subcat))
+        n_prod = int(counts.sum())
+        offsets = np.concatenate(([0], np.cumsum(counts)))
+
+        prod_category = np.repeat(group_category, counts)
+        prod_subcategory = np.repeat(group_subcat, counts)
+
+        # Brand pools differ per category, so brands are one draw per group
+        brands = np.empty(n_prod, dtype='U16')
+        for g, pool in enumerate(group_brands):
+            lo, hi = offsets[g], offsets[g + 1]
+            brands[lo:hi] = pool[self.rng.integers(0, len(pool), size=hi - lo)]
+
+        # Product names: brand + singular subcategory + suffix, composed with
+        # np.char and stripped once to absorb the empty suffixes
+        elec_suffixes = np.array(['Pro', 'Max', 'Ultra', 'Plus', 'Mini', ''])
+        other_suffixes = np.array(['Premium', 'Classic', 'Sport', 'Deluxe', ''])
+        is_elec = prod_category == 'Electronics'
+        suffixes = np.empty(n_prod, dtype='U8')
+        suffixes[is_elec] = elec_suffixes[self.rng.integers(0, len(elec_suffixes), size=int(is_elec.sum()))]
+        suffixes[~is_elec] = other_suffixes[self.rng.integers(0, len(other_suffixes), size=int((~is_elec).sum()))]
+        singular = np.repeat([s.rstrip('s') for s in group_subcat], counts)
+        names = np.char.strip(np.char.add(np.char.add(np.char.add(np.char.add(
+            brands, ' '), singular), ' '), suffixes))
+
+        # Prices: uniform() broadcasts the per-row low/high bounds directly
+        list_prices = np.round(self.rng.uniform(np.repeat(group_lo, counts),
+                                                np.repeat(group_hi, counts)), 2)
+        cost_prices = np.round(list_prices * self.rng.uniform(0.4, 0.8, size=n_prod), 2)  # Cost is 40-80% of list price
+
+        # Parallel arrays are the catalog; low-cardinality attributes are
+        # categoricals so batch gathers move int codes, not repeated strings
+        self._prod_ids = np.char.add('PRD_', np.char.zfill((np.arange(n_prod) + 1).astype('U3'), 3)).astype(object)
+        self._prod_name = names.astype(object)
+        self._prod_category = pd.Categorical(prod_category)
+        self._prod_subcategory = pd.Categorical(prod_subcategory)
+        self._prod_brand = pd.Categorical(brands)
+        # float32 keeps full precision for 2-decimal prices at half the bytes
+        self._prod_cost = cost_prices.astype(np.float32)
+        self._prod_list_price = list_prices.astype(np.float32)
+
+        print(f"Created {n_prod} products across 5 categories")
+
     def setup_warehouses(self):
         """Generate 50 warehouses across 10 cities"""
         print("Setting up warehouse network...")
@@ -268,7 +472,17 @@ class MessyEcommerceGenerator:
                     'country': 'US'
                 }
                 warehouse_num += 1
-        
+
+        # SoA mirrors of the warehouse network
+        self._wh_ids = np.array(list(self.warehouses.keys()), dtype=object)
+        self._wh_city = pd.Categorical([w['city'] for w in self.warehouses.values()])
+        self._wh_state = pd.Categorical([w['state'] for w in self.warehouses.values()])
+        self._wh_country = pd.Categorical([w['country'] for w in self.warehouses.values()])
+
+        # state -> warehouse indices, so batches never rescan all warehouses
+        self._wh_by_state = {state: np.flatnonzero(self._wh_state == state)
+                             for state in set(self._wh_state.tolist())}
+
         print(f"Created {len(self.warehouses)} warehouses across 10 cities")
     
     def setup_date_range(self):
@@ -290,26 +504,56 @@ class MessyEcommerceGenerator:
                 'datetime_obj': current_date
             })
             current_date += timedelta(days=1)
-        
+
+        # Weekday per date, for vectorized weekday-weighted selection
+        self._date_weekday = np.array([d['datetime_obj'].weekday() for d in self.dates])
+
+        self.date_formats = [
+            "%Y-%m-%d",          # 2025-09-20
+            "%Y/%m/%d",          # 2025/09/20
+            "%d-%b-%Y",          # 20-Sep-2025
+            "%d %B %Y",          # 20 September 2025
+            "%b %d, %Y",         # Sep 20, 2025
+            "%B %d, %Y",         # September 20, 2025
+        ]
+
+        # Pre-render every emittable date string once: the order-date range
+        # plus the registration window (up to 1095 days earlier), x 6 formats.
+        # Batches then gather strings by (day, format) index - no strftime in
+        # the hot path.
+        self._reg_window_days = 1095
+        first_day = self.start_date - timedelta(days=self._reg_window_days)
+        n_days = (self.end_date - first_day).days + 1
+        self._day_formatted = np.array(
+            [[(first_day + timedelta(days=i)).strftime(fmt) for fmt in self.date_formats]
+             for i in range(n_days)],
+            dtype=object
+        )
+
         print(f"Created {len(self.dates)} dates for Q1 2024")
     
     def setup_other_lookups(self):
-        """Setup other lookup data"""
-        self.order_statuses = ['pending', 'confirmed', 'shipped', 'delivered', 'cancelled']
-        self.payment_methods = ['credit_card', 'debit_card', 'paypal', 'apple_pay', 'google_pay']
-        self.payment_statuses = ['success', 'failed', 'pending']
-        self.shipping_methods = ['standard', 'express', 'overnight']
-        self.genders = ['M', 'F', 'Other']
-        
-        # Return/refund values
-        self.return_values = ['yes', 'no', 'pending', 'true', 'false', '1', '0']
+        """Setup other lookup data, as object arrays so the per-batch
+        rng.choice draws skip the list->array conversion every call"""
+        self.order_statuses = np.array(['pending', 'confirmed', 'shipped', 'delivered', 'cancelled'], dtype=object)
+        self.payment_methods = np.array(['credit_card', 'debit_card', 'paypal', 'apple_pay', 'google_pay'], dtype=object)
+        self.payment_statuses = np.array(['success', 'failed', 'pending'], dtype=object)
+        self.shipping_methods = np.array(['standard', 'express', 'overnight'], dtype=object)
+        self.genders = np.array(['M', 'F', 'Other'], dtype=object)
+
+        # Return/refund values, with the family LUT and refund pools the
+        # vectorized return/refund draw gathers from
+        self.return_values = np.array(['yes', 'no', 'pending', 'true', 'false', '1', '0'], dtype=object)
+        self._refund_family = np.array([0, 2, 1, 0, 2, 0, 2], dtype=np.int8)  # 0 yes-family, 1 pending, 2 no-family
+        self._refund_yes = np.array(['yes', 'true', '1'], dtype=object)
+        self._refund_no = np.array(['no', 'false', '0'], dtype=object)
     
     def get_order_status_for_payment(self, payment_status):
         """Get appropriate order status based on payment status"""
         if payment_status == 'failed':
-            return random.choice(['pending', 'cancelled'])
+            return str(self.rng.choice(['pending', 'cancelled']))
         elif payment_status == 'success':
-            return random.choice(['delivered', 'shipped'])
+            return str(self.rng.choice(['delivered', 'shipped']))
         elif payment_status == 'pending':
             return 'pending'
         else:
@@ -317,160 +561,185 @@ class MessyEcommerceGenerator:
     
     def get_return_refund_pair(self):
         """Generate correlated return/refund values"""
-        return_status = random.choice(self.return_values)
-        
+        return_status = str(self.rng.choice(self.return_values))
+
         # Map return status to refund status with some correlation
         if return_status in ['yes', 'true', '1']:
-            refund_status = random.choice(['yes', 'true', '1'])
+            refund_status = str(self.rng.choice(['yes', 'true', '1']))
         elif return_status in ['pending']:
             refund_status = 'pending'
         else:  # no, false, 0
-            refund_status = random.choice(['no', 'false', '0'])
+            refund_status = str(self.rng.choice(['no', 'false', '0']))
         
         return return_status, refund_status
     
-    def introduce_messiness(self, value, column_name, messiness_rate=0.12):
-        """Introduce various types of data quality issues"""
-        if random.random() > messiness_rate:
-            return value
-        
-        # Different types of messiness based on data type and column
-        mess_types = ['null', 'format_error', 'typo', 'extra_space', 'case_issue', 'multiple_values', 'invalid_value']
-        
-        # Column-specific messiness patterns
+    def messy_column(self, values, column_name, messiness_rate=0.12, gate_probs=None):
+        """Introduce various types of data quality issues, one column at a time"""
+        values = np.array(values, dtype=object)
+        n = len(values)
+
         if 'email' in column_name:
-            if random.random() < 0.3:
-                return str(value).replace('@', '')  # Missing @ symbol
-            elif random.random() < 0.2:
-                return f"{value}|{value.replace('gmail', 'yahoo')}"  # Multiple emails
-        
+            col_kind = 1
         elif 'phone' in column_name:
-            if random.random() < 0.25:
-                return np.nan  # Missing phone numbers are common
-            elif random.random() < 0.2:
-                return str(value).replace('-', '').replace('(', '').replace(')', '').replace(' ', '')  # Format variations
-        
+            col_kind = 2
         elif 'age' in column_name:
-            if random.random() < 0.15:
-                return random.choice([-5, 150, 999, '25 years old', None])  # Invalid ages
-        
+            col_kind = 3
         elif 'quantity' in column_name:
-            if random.random() < 0.08:
-                return random.choice([-1, 0, 'two', '', 999])  # Invalid quantities
-        
+            col_kind = 4
         elif 'price' in column_name or 'cost' in column_name or 'amount' in column_name:
-            if random.random() < 0.05:
-                return f"${value}" if isinstance(value, (int, float)) else value  # Currency symbol
-            elif random.random() < 0.03:
-                return str(value) + '_error'  # Invalid format
-        
+            col_kind = 5
+        else:
+            col_kind = 0
+
+        # All per-cell branching happens in the (optionally numba-compiled)
+        # numeric kernel; Python only applies the string edits per code
+        if gate_probs is None:
+            gate_probs = self.rng.random(n)
+        gate = gate_probs < messiness_rate
+        if not gate.any():
+            return values
+        codes = _assign_mess_codes(
+            gate,
+            self.rng.random(n),
+            self.rng.random(n),
+            self.rng.integers(0, 7, size=n).astype(np.int8),
+            col_kind,
+        )
+
+        # Column-specific messiness patterns
+        if col_kind == 1:
+            for i in np.flatnonzero(codes == 10):
+                values[i] = str(values[i]).replace('@', '')  # Missing @ symbol
+            for i in np.flatnonzero(codes == 11):
+                values[i] = f"{values[i]}|{str(values[i]).replace('gmail', 'yahoo')}"  # Multiple emails
+
+        elif col_kind == 2:
+            values[codes == 10] = np.nan  # Missing phone numbers are common
+            for i in np.flatnonzero(codes == 11):
+                values[i] = str(values[i]).replace('-', '').replace('(', '').replace(')', '').replace(' ', '')  # Format variations
+
+        elif col_kind == 3:
+            bad = np.flatnonzero(codes == 10)
+            bad_ages = np.array([-5, 150, 999, '25 years old', None], dtype=object)
+            values[bad] = bad_ages[self.rng.integers(0, len(bad_ages), size=len(bad))]  # Invalid ages
+
+        elif col_kind == 4:
+            bad = np.flatnonzero(codes == 10)
+            bad_qtys = np.array([-1, 0, 'two', '', 999], dtype=object)
+            values[bad] = bad_qtys[self.rng.integers(0, len(bad_qtys), size=len(bad))]  # Invalid quantities
+
+        elif col_kind == 5:
+            for i in np.flatnonzero(codes == 10):
+                if isinstance(values[i], (int, float)):
+                    values[i] = f"${values[i]}"  # Currency symbol
+            for i in np.flatnonzero(codes == 11):
+                values[i] = str(values[i]) + '_error'  # Invalid format
+
         # General messiness patterns
-        mess_type = random.choice(mess_types)
-        
-        if mess_type == 'null':
-            return np.nan if random.random() < 0.7 else None
-        
-        elif mess_type == 'multiple_values' and isinstance(value, str):
-            return f"{value}|{value}_alt"
-        
-        elif mess_type == 'typo' and isinstance(value, str) and len(value) > 3:
-            pos = random.randint(1, len(value)-2)
-            return value[:pos] + random.choice('xyz123@#') + value[pos+1:]
-        
-        elif mess_type == 'extra_space' and isinstance(value, str):
-            return f"  {value}  " if random.random() < 0.5 else f"{value}   "
-        
-        elif mess_type == 'case_issue' and isinstance(value, str):
-            return value.upper() if random.random() < 0.5 else value.lower()
-        
-        elif mess_type == 'format_error' and isinstance(value, (int, float)):
-            return str(value) + random.choice(['_invalid', '.0.0', 'ERROR'])
-        
-        return value
-    
-    def generate_batch_data(self, batch_start, batch_size):
-        """Generate a batch of messy e-commerce data"""
+        # 0=null, 1=format_error, 2=typo, 3=extra_space, 4=case_issue, 5=multiple_values, 6=invalid_value
+        nulls = np.flatnonzero(codes == 0)
+        values[nulls] = np.where(self.rng.random(len(nulls)) < 0.7, np.nan, None)
+
+        for i in np.flatnonzero(codes == 1):
+            if isinstance(values[i], (int, float)):
+                values[i] = str(values[i]) + str(self.rng.choice(['_invalid', '.0.0', 'ERROR']))
+
+        for i in np.flatnonzero(codes == 2):
+            v = values[i]
+            if isinstance(v, str) and len(v) > 3:
+                pos = int(self.rng.integers(1, len(v)-1))
+                values[i] = v[:pos] + str(self.rng.choice(list('xyz123@#'))) + v[pos+1:]
+
+        for i in np.flatnonzero(codes == 3):
+            if isinstance(values[i], str):
+                values[i] = f"  {values[i]}  " if self.rng.random() < 0.5 else f"{values[i]}   "
+
+        for i in np.flatnonzero(codes == 4):
+            if isinstance(values[i], str):
+                values[i] = values[i].upper() if self.rng.random() < 0.5 else values[i].lower()
+
+        for i in np.flatnonzero(codes == 5):
+            if isinstance(values[i], str):
+                values[i] = f"{values[i]}|{values[i]}_alt"
+
+        # code 6 (invalid_value) leaves the cell unchanged, as before
+        return values
+
+    def _scratch(self, name, n):
+        """Reusable object buffer for columns filled incrementally.
+
+        Gathers allocate their own output anyway, but the mask-filled
+        columns can recycle one allocation across the batches this
+        instance runs - each pool worker holds one instance for its whole
+        lifetime (_init_worker), so the reuse spans every batch that
+        worker handles. Safe because messy_column copies its input before
+        the buffer is reused.
+        """
+        buf = self._scratch_bufs.get(name)
+        if buf is None or len(buf) != n:
+            buf = np.empty(n, dtype=object)
+            self._scratch_bufs[name] = buf
+        return buf
+
+    def generate_batch_arrays(self, batch_start, batch_size, seed=None):
+        """Generate a batch of messy e-commerce data as a dict of ndarrays
+
+        The columnar dict is the native product of the vectorized build;
+        pl.DataFrame(...) ingests it zero-copy through arrow buffers for
+        callers that want to skip the pandas layer entirely.
+        """
         print(f"Generating batch starting at row {batch_start:,}")
-        
+
+        if seed is not None:
+            # Worker processes inherit an identically seeded generator, so
+            # each batch swaps in its own Generator (seed is usually a
+            # spawned SeedSequence, which default_rng takes directly)
+            self.rng = np.random.default_rng(seed)
+
         batch_data = {}
+
+        # One probability matrix feeds every messiness gate in the batch -
+        # a single bulk draw instead of one random(n) call per messy column
+        mess_gates = iter(self.rng.random((batch_size, self._N_MESSY_COLS)).T)
         
         # Orders (5 columns - removed tax_amount)
-        batch_data['order_id'] = [str(uuid.uuid4()) for _ in range(batch_size)]
-        
-        date_formats = [
-            "%Y-%m-%d",          # 2025-09-20
-            "%Y/%m/%d",          # 2025/09/20
-            "%d-%b-%Y",          # 20-Sep-2025
-            "%d %B %Y",          # 20 September 2025
-            "%b %d, %Y",         # Sep 20, 2025
-            "%B %d, %Y",         # September 20, 2025
-        ]
+        batch_data['order_id'] = batch_uuid4_strings(batch_size)
+        
+        # Select random dates with some business patterns - more orders on
+        # weekdays (weekday first picks get a 30% chance to re-roll)
+        first_pick = self.rng.integers(0, len(self.dates), size=batch_size)
+        repick = (self._date_weekday[first_pick] < 5) & (self.rng.random(batch_size) >= 0.7)
+        second_pick = self.rng.integers(0, len(self.dates), size=batch_size)
+        date_idx = np.where(repick, second_pick, first_pick)
 
-        # selected_dates = []
-
-        # for _ in range(batch_size):
-        #     date_info = random.choice(self.dates)
-            
-        #     # Add some business seasonality
-        #     if date_info['datetime_obj'].weekday() < 5:  # Monday-Friday
-        #         if random.random() < 0.7:
-        #             chosen_date = date_info['datetime_obj']
-        #         else:
-        #             chosen_date = random.choice(self.dates)['datetime_obj']
-        #     else:
-        #         chosen_date = date_info['datetime_obj']
-            
-        #     # Randomly pick a format
-        #     fmt = random.choice(date_formats)
-        #     formatted_date = chosen_date.strftime(fmt)
-            
-        #     selected_dates.append(chosen_date)
-            
-        
-        # Select random dates with some business patterns
-        selected_dates = []
-        for _ in range(batch_size):
-            date_info = random.choice(self.dates)
-            # Add some business seasonality - more orders on weekdays
-            if date_info['datetime_obj'].weekday() < 5:  # Monday-Friday
-                if random.random() < 0.7:  # 70% chance to pick weekday
-                    selected_dates.append(date_info)
-                else:
-                    selected_dates.append(random.choice(self.dates))
-            else:
-                selected_dates.append(date_info)
-        
-        # print(f"################# selected dates: {selected_dates}")
-        
-        
-        order_date_list = []
-        for s in selected_dates:
-            fmt = random.choice(date_formats)
-            order_date_list.append(s['datetime_obj'].strftime(fmt))
-            
-        
-        batch_data['order_date'] = order_date_list
-        batch_data['order_time'] = [self.introduce_messiness(f"{random.randint(0,23):02d}:{random.randint(0,59):02d}:{random.randint(0,59):02d}", 'order_time', 0.05) for _ in range(batch_size)]
+        # Gather pre-rendered date strings by (day, format) index
+        order_day = date_idx + self._reg_window_days
+        fmt_idx = self.rng.integers(0, len(self.date_formats), size=batch_size)
+        batch_data['order_date'] = self._day_formatted[order_day, fmt_idx]
+        # All seconds-of-day in one draw, formatted with a single vectorized strftime
+        order_secs = self.rng.integers(0, 86400, size=batch_size)
+        order_times = pd.to_datetime(order_secs, unit='s').strftime('%H:%M:%S').to_numpy()
+        batch_data['order_time'] = self.messy_column(order_times, 'order_time', 0.05, gate_probs=next(mess_gates))
         
         # Generate payment status first, then determine order status
-        payment_statuses = [random.choice(self.payment_statuses) for _ in range(batch_size)]
-        order_statuses = [self.get_order_status_for_payment(ps) for ps in payment_statuses]
-        
-        batch_data['order_status'] = [self.introduce_messiness(status, 'order_status', 0.06) for status in order_statuses]
-        batch_data['shipping_cost'] = [self.introduce_messiness(round(random.uniform(0.5, 9.99), 2), 'shipping_cost', 0.10) for _ in range(batch_size)]
-        
+        payment_statuses = self.rng.choice(self.payment_statuses, size=batch_size)
+        order_statuses = self._scratch('order_statuses', batch_size)
+        failed = payment_statuses == 'failed'
+        success = payment_statuses == 'success'
+        order_statuses[failed] = self.rng.choice(['pending', 'cancelled'], size=int(failed.sum()))
+        order_statuses[success] = self.rng.choice(['delivered', 'shipped'], size=int(success.sum()))
+        order_statuses[~(failed | success)] = 'pending'
+        
+        batch_data['order_status'] = self.messy_column(order_statuses, 'order_status', 0.06, gate_probs=next(mess_gates))
+        batch_data['shipping_cost'] = self.messy_column(np.round(self.rng.uniform(0.5, 9.99, size=batch_size), 2), 'shipping_cost', 0.10, gate_probs=next(mess_gates))
+
         # Customers (9 columns) - with realistic repeat behavior
-        selected_customers = []
-        for _ in range(batch_size):
-            customer_id = random.choice(self.weighted_customers)
-            selected_customers.append(customer_id)
-            
-        # print(f"######### selected_customers ########: \n {self.customers}")
-        
-        batch_data['customer_id'] = [cid for cid in selected_customers]
-        batch_data['customer_email'] = [self.customers[cid]['email'] for cid in selected_customers]
-        batch_data['customer_first_name'] = [self.customers[cid]['first_name']for cid in selected_customers]
-        batch_data['customer_last_name'] = [self.customers[cid]['last_name']for cid in selected_customers]
+        cust_idx = self.rng.choice(len(self._cust_p), size=batch_size, p=self._cust_p)
+
+        batch_data['customer_id'] = self._cust_ids[cust_idx]
+        batch_data['customer_email'] = self._cust_email[cust_idx]
+        batch_data['customer_first_name'] = self._cust_first[cust_idx]
+        batch_data['customer_last_name'] = self._cust_last[cust_idx]
         
         # Generate phone numbers with various formats
         # phone_numbers = []
@@ -487,172 +756,247 @@ class MessyEcommerceGenerator:
         #     ]
         #     phone_numbers.append(random.choice(formats))
         
-        def generate_age():
-            return random.randint(18, 80)
-        
-        batch_data['customer_phone'] = [self.customers[cid]['phone'] for cid in selected_customers]
-        batch_data['customer_age'] = [self.introduce_messiness(self.customers[cid]['age'], 'customer_age', 0.12) for cid in selected_customers]
-        batch_data['customer_gender'] = [self.introduce_messiness(self.customers[cid]['gender'], 'customer_gender', 0.08) for cid in selected_customers]
+        batch_data['customer_phone'] = self._cust_phone[cust_idx]
+        batch_data['customer_age'] = self.messy_column(self._cust_age[cust_idx], 'customer_age', 0.12, gate_probs=next(mess_gates))
+        batch_data['customer_gender'] = self.messy_column(self._cust_gender[cust_idx], 'customer_gender', 0.08, gate_probs=next(mess_gates))
         
         # Registration dates (before order dates)
-        reg_dates = []
-        for date_info in selected_dates:
-            fmt = random.choice(date_formats)
-            order_date = date_info['datetime_obj']
-            # Registration should be before order date
-            days_before = random.randint(30, 1095)  # 1 month to 3 years before
-            reg_date = order_date - timedelta(days=days_before)
-            reg_dates.append(reg_date.strftime(fmt))
-        
-        batch_data['customer_registration_date'] = reg_dates
+        days_before = self.rng.integers(30, 1096, size=batch_size)  # 1 month to 3 years before
+        reg_fmt_idx = self.rng.integers(0, len(self.date_formats), size=batch_size)
+        batch_data['customer_registration_date'] = self._day_formatted[order_day - days_before, reg_fmt_idx]
         
         # Customer geography
-        customer_cities = []
-        customer_states = []
-        for _ in range(batch_size):
-            city, state = random.choice(self.cities_states)
-            customer_cities.append(city)
-            customer_states.append(state)
-        
-        batch_data['customer_city'] = [self.introduce_messiness(city, 'customer_city', 0.07) for city in customer_cities]
-        batch_data['customer_state'] = [self.introduce_messiness(state, 'customer_state', 0.05) for state in customer_states]
+        cs_idx = self.rng.integers(0, len(self.cities_states), size=batch_size)
+        customer_cities = self._cities_arr[cs_idx]
+        customer_states = self._states_arr[cs_idx]
+
+        batch_data['customer_city'] = self.messy_column(customer_cities, 'customer_city', 0.07, gate_probs=next(mess_gates))
+        batch_data['customer_state'] = self.messy_column(customer_states, 'customer_state', 0.05, gate_probs=next(mess_gates))
         
         # Products (7 columns)
-        selected_products = []
-        for _ in range(batch_size):
-            product_id = random.choice(list(self.products.keys()))
-            selected_products.append(product_id)
-        
-        batch_data['product_id'] = selected_products
-        batch_data['product_name'] = [self.products[pid]['name'] for pid in selected_products]
-        batch_data['product_category'] = [self.products[pid]['category'] for pid in selected_products]
-        batch_data['product_subcategory'] = [self.products[pid]['subcategory'] for pid in selected_products]
-        batch_data['product_brand'] = [self.products[pid]['brand'] for pid in selected_products]
-        batch_data['product_cost'] = [self.products[pid]['cost'] for pid in selected_products]
-        batch_data['product_list_price'] = [self.products[pid]['list_price'] for pid in selected_products]
+        product_idx = self.rng.integers(0, len(self._prod_ids), size=batch_size)
+
+        batch_data['product_id'] = self._prod_ids[product_idx]
+        batch_data['product_name'] = self._prod_name[product_idx]
+        batch_data['product_category'] = self._prod_category.take(product_idx)
+        batch_data['product_subcategory'] = self._prod_subcategory.take(product_idx)
+        batch_data['product_brand'] = self._prod_brand.take(product_idx)
+        batch_data['product_cost'] = self._prod_cost[product_idx]
+        batch_data['product_list_price'] = self._prod_list_price[product_idx]
         
         # Warehouses (4 columns)
-        selected_warehouses = []
-        for i in range(batch_size):
-            # Smart warehouse selection - prefer same state as customer 80% of time
-            customer_state = customer_states[i]
-            
-            # Find warehouses in same state
-            same_state_warehouses = [wid for wid, wdata in self.warehouses.items() if wdata['state'] == customer_state]
-            
-            if same_state_warehouses and random.random() < 0.8:
-                warehouse_id = random.choice(same_state_warehouses)
-            else:
-                warehouse_id = random.choice(list(self.warehouses.keys()))
-            
-            selected_warehouses.append(warehouse_id)
-        
-        batch_data['warehouse_id'] = selected_warehouses
-        batch_data['warehouse_city'] = [self.warehouses[wid]['city'] for wid in selected_warehouses]
-        batch_data['warehouse_state'] = [self.warehouses[wid]['state'] for wid in selected_warehouses]
-        batch_data['warehouse_country'] = [self.warehouses[wid]['country'] for wid in selected_warehouses]
+        # Smart warehouse selection - prefer same state as customer 80% of
+        # time; rows are grouped by state so each group is one bulk draw
+        warehouse_idx = self.rng.integers(0, len(self._wh_ids), size=batch_size)
+        same_state_roll = self.rng.random(batch_size) < 0.8
+        state_codes, state_uniques = pd.factorize(customer_states)
+        for code, state in enumerate(state_uniques):
+            pool = self._wh_by_state.get(state)
+            if pool is None:
+                continue
+            rows = np.flatnonzero((state_codes == code) & same_state_roll)
+            warehouse_idx[rows] = pool[self.rng.integers(0, len(pool), size=len(rows))]
+
+        batch_data['warehouse_id'] = self._wh_ids[warehouse_idx]
+        batch_data['warehouse_city'] = self._wh_city.take(warehouse_idx)
+        batch_data['warehouse_state'] = self._wh_state.take(warehouse_idx)
+        batch_data['warehouse_country'] = self._wh_country.take(warehouse_idx)
         
         # Transaction Details (8 columns)
-        quantities = []
-        line_totals = []
-        
-        for i in range(batch_size):
-            qty = random.randint(1, 10)
-            
-            quantities.append(qty)
-        
-        batch_data['quantity_ordered'] = [qty for qty in quantities]
+        quantities = self.rng.integers(1, 11, size=batch_size, dtype=np.int16)
+
+        batch_data['quantity_ordered'] = quantities
         # batch_data['line_total'] = [self.introduce_messiness(total, 'line_total', 0.05) for total in line_totals]
         
         # batch_data['discount_amount'] = [self.introduce_messiness(round(random.uniform(0, 50), 2), 'discount_amount', 0.40) for _ in range(batch_size)]  # Many nulls
         # batch_data['discount_percent'] = [self.introduce_messiness(round(random.uniform(0, 25), 1), 'discount_percent', 0.45) for _ in range(batch_size)]  # Many nulls
         # batch_data['coupon_code'] = [self.introduce_messiness(f"SAVE{random.randint(5,50)}", 'coupon_code', 0.70) for _ in range(batch_size)]  # Mostly null
-        batch_data['payment_method'] = [self.introduce_messiness(random.choice(self.payment_methods), 'payment_method', 0.05) for _ in range(batch_size)]
-        batch_data['payment_status'] = [self.introduce_messiness(ps, 'payment_status', 0.04) for ps in payment_statuses]
-        
-        # Return and Refund columns (2 columns)
-        return_refund_pairs = [self.get_return_refund_pair() for _ in range(batch_size)]
-        batch_data['order_returned'] = [self.introduce_messiness(pair[0], 'order_returned', 0.10) for pair in return_refund_pairs]
-        batch_data['payment_refunded'] = [self.introduce_messiness(pair[1], 'payment_refunded', 0.10) for pair in return_refund_pairs]
+        batch_data['payment_method'] = self.messy_column(self.rng.choice(self.payment_methods, size=batch_size), 'payment_method', 0.05, gate_probs=next(mess_gates))
+        batch_data['payment_status'] = self.messy_column(payment_statuses, 'payment_status', 0.04, gate_probs=next(mess_gates))
+        
+        # Return and Refund columns (2 columns), correlated like
+        # get_return_refund_pair but drawn in bulk: a code per row, a LUT
+        # mapping codes to the yes/pending/no family, then one refund draw
+        # per family
+        ret_code = self.rng.integers(0, len(self.return_values), size=batch_size)
+        family = self._refund_family[ret_code]
+
+        refunds = self._scratch('refunds', batch_size)
+        refunds[family == 1] = 'pending'
+        yes_rows = family == 0
+        no_rows = family == 2
+        refunds[yes_rows] = self._refund_yes[self.rng.integers(0, 3, size=int(yes_rows.sum()))]
+        refunds[no_rows] = self._refund_no[self.rng.integers(0, 3, size=int(no_rows.sum()))]
+
+        batch_data['order_returned'] = self.messy_column(self.return_values[ret_code], 'order_returned', 0.10, gate_probs=next(mess_gates))
+        batch_data['payment_refunded'] = self.messy_column(refunds, 'payment_refunded', 0.10, gate_probs=next(mess_gates))
         
         # Shipping/Geography (7 columns) with real ZIP codes
-        shipping_addresses = []
-        shipping_cities = []
-        shipping_states = []
-        shipping_zips = []
-        
-        for i in range(batch_size):
-            # Generate street address
-            street_num = random.randint(1, 9999)
-            street_names = ['Main St', 'Oak Ave', 'Elm Dr', 'First St', 'Second Ave', 'Park Rd', 'Maple St', 'Cedar Ave']
-            address = f"{street_num} {random.choice(street_names)}"
-            shipping_addresses.append(address)
-            
-            # 85% same city/state as customer, 15% different
-            if random.random() < 0.85:
-                ship_city = customer_cities[i]
-                ship_state = customer_states[i]
-            else:
-                ship_city, ship_state = random.choice(self.cities_states)
-            
-            shipping_cities.append(ship_city)
-            shipping_states.append(ship_state)
-            
-            # Generate correct ZIP for city/state, then make it messy
-            correct_zip = self.get_zip_for_city_state(ship_city, ship_state)
-            shipping_zips.append(correct_zip)
-        
-        batch_data['shipping_address_line1'] = shipping_addresses
-        batch_data['shipping_address_line2'] = [self.introduce_messiness(f"Apt {random.randint(1,999)}", 'shipping_address_line2', 0.65) for _ in range(batch_size)]  # Mostly null
-        batch_data['shipping_city'] = [city for city in shipping_cities]
-        batch_data['shipping_state'] = [state for state in shipping_states]
-        batch_data['shipping_zip'] = shipping_zips  # Already messy from create_messy_zip
-        batch_data['shipping_country'] = [self.introduce_messiness('US', 'shipping_country', 0.03) for _ in range(batch_size)]
-        batch_data['shipping_method'] = [self.introduce_messiness(random.choice(self.shipping_methods), 'shipping_method', 0.05) for _ in range(batch_size)]
-        
-        return pd.DataFrame(batch_data)
-    
+        # 85% same city/state as customer, 15% different
+        diff_mask = self.rng.random(batch_size) >= 0.85
+        ship_cs_idx = self.rng.integers(0, len(self.cities_states), size=batch_size)
+        shipping_cities = np.where(diff_mask, self._cities_arr[ship_cs_idx], customer_cities)
+        shipping_states = np.where(diff_mask, self._states_arr[ship_cs_idx], customer_states)
+
+        # Correct ZIPs for each city/state: one broadcast draw against the
+        # CSR offsets covers every group at once
+        ship_cs = np.where(diff_mask, ship_cs_idx, cs_idx)
+        starts = self._zip_offsets[ship_cs]
+        pool_sizes = self._zip_offsets[ship_cs + 1] - starts
+        shipping_zips = self._zip_flat[starts + self.rng.integers(0, pool_sizes)]
+
+        # Generate street addresses: all numbers and street picks at once,
+        # composed with np.char instead of an f-string per row
+        street_names = np.array(['Main St', 'Oak Ave', 'Elm Dr', 'First St', 'Second Ave', 'Park Rd', 'Maple St', 'Cedar Ave'])
+        street_nums = self.rng.integers(1, 10000, size=batch_size).astype('U4')
+        picked_streets = street_names[self.rng.integers(0, len(street_names), size=batch_size)]
+        shipping_addresses = np.char.add(np.char.add(street_nums, ' '), picked_streets)
+
+        batch_data['shipping_address_line1'] = shipping_addresses.astype(object)
+        apt_strs = np.char.add('Apt ', self.rng.integers(1, 1000, size=batch_size).astype('U3')).astype(object)
+        batch_data['shipping_address_line2'] = self.messy_column(apt_strs, 'shipping_address_line2', 0.65, gate_probs=next(mess_gates))  # Mostly null
+        batch_data['shipping_city'] = shipping_cities
+        batch_data['shipping_state'] = shipping_states
+        batch_data['shipping_zip'] = shipping_zips
+        batch_data['shipping_country'] = self.messy_column(np.full(batch_size, 'US', dtype=object), 'shipping_country', 0.03, gate_probs=next(mess_gates))
+        batch_data['shipping_method'] = self.messy_column(self.rng.choice(self.shipping_methods, size=batch_size), 'shipping_method', 0.05, gate_probs=next(mess_gates))
+        
+        return batch_data
+
+    def generate_batch_data(self, batch_start, batch_size, seed=None):
+        """Generate a batch of messy e-commerce data as a pandas DataFrame"""
+        # Columns are already typed ndarrays/Categoricals, so adopt them
+        # directly instead of re-inferring and copying each one
+        return pd.DataFrame(self.generate_batch_arrays(batch_start, batch_size, seed), copy=False)
+
+
+    def _batch_frames(self, executor, batch_plan, batch_seeds, window):
+        """Yield batch DataFrames in plan order with bounded lookahead.
+
+        At most `window` futures are in flight at a time, so completed
+        batches can't pile up in the parent faster than the writer drains
+        them - peak memory stays flat no matter how many batches the run
+        has. Tasks only carry the batch coordinates; the generator itself
+        ships once per worker via the pool initializer.
+        """
+        in_flight = deque()
+        next_submit = 0
+        while next_submit < len(batch_plan) or in_flight:
+            while next_submit < len(batch_plan) and len(in_flight) < window:
+                start, size = batch_plan[next_submit]
+                in_flight.append(executor.submit(
+                    _worker_batch, start, size, batch_seeds[next_submit]))
+                next_submit += 1
+            yield in_flight.popleft().result()
+
     def generate_csv(self, filename='input/messy_ecommerce_1K.csv'):
-        """Generate the complete CSV file in batches"""
+        """Generate the complete CSV file in batches
+
+        Writer selection is pyarrow > polars > pandas. A hand-rolled
+        b','.join serializer over pre-encoded columns was considered and
+        rejected: messy cells deliberately embed commas and quotes
+        ("v,v" duplicates, junk suffixes), so correct output requires
+        real CSV quoting - exactly what the C/C++ writers already do at
+        memory-bandwidth speed.
+        """
         print(f"\nStarting generation of {self.total_rows:,} rows of messy e-commerce data...")
         print(f"Output file: {filename}")
         start_time = time.time()
         
-        # Calculate number of batches
+        # Plan all batches up front
         num_batches = (self.total_rows + self.batch_size - 1) // self.batch_size
-        
-        # Generate first batch to create file with headers
-        first_batch = self.generate_batch_data(0, min(self.batch_size, self.total_rows))
-        first_batch.to_csv(filename, index=False, mode='w')
-        rows_written = len(first_batch)
-        
-        print(f"Column structure: {len(first_batch.columns)} columns")
-        print(f"Columns: {', '.join(first_batch.columns)}")
-        
-        # Generate remaining batches
-        for batch_num in range(1, num_batches):
+        batch_plan = []
+        for batch_num in range(num_batches):
             batch_start = batch_num * self.batch_size
             current_batch_size = min(self.batch_size, self.total_rows - batch_start)
-            
             if current_batch_size <= 0:
                 break
-            
-            batch_df = self.generate_batch_data(batch_start, current_batch_size)
-            batch_df.to_csv(filename, index=False, mode='a', header=False)
-            rows_written += len(batch_df)
-            
-            # Memory cleanup
-            del batch_df
-            gc.collect()
-            
-            # Progress update
-            if batch_num % 5 == 0:
-                elapsed = time.time() - start_time
-                rate = rows_written / elapsed
-                remaining_rows = self.total_rows - rows_written
-                eta = remaining_rows / rate if rate > 0 else 0
-                print(f"Progress: {rows_written:,}/{self.total_rows:,} ({rows_written/self.total_rows*100:.1f}%) - Rate: {rate:,.0f} rows/sec - ETA: {eta:.0f}s")
-        
+            batch_plan.append((batch_start, current_batch_size))
+
+        # Independent, collision-free RNG streams per batch: spawn a child
+        # SeedSequence for each instead of handing out base_seed + i
+        batch_seeds = np.random.SeedSequence(42).spawn(len(batch_plan))
+
+        # Batch generation is CPU-bound pure Python, so fan out across cores
+        # (threads would serialize on the GIL); writes stay in order here
+        rows_written = 0
+        # Writer preference: arrow's CSVWriter (opened once, C++ formatter),
+        # then polars, then pandas - the latter two share one file handle
+        # kept open for the whole run instead of reopening in append mode
+        # per batch
+        writer = None
+        sink = None
+        pending = []  # pandas path: batches awaiting a grouped concat+write
+        if not HAVE_PYARROW:
+            sink = open(filename, 'wb') if HAVE_POLARS else open(filename, 'w', newline='')
+        max_workers = min(os.cpu_count(), len(batch_plan))
+        try:
+            with ProcessPoolExecutor(max_workers=max_workers,
+                                     initializer=_init_worker,
+                                     initargs=(self,)) as executor:
+                frames = self._batch_frames(executor, batch_plan, batch_seeds, 2 * max_workers)
+                for batch_num, batch_df in enumerate(frames):
+                    if batch_num == 0:
+                        print(f"Column structure: {len(batch_df.columns)} columns")
+                        print(f"Columns: {', '.join(batch_df.columns)}")
+
+                    if HAVE_PYARROW or HAVE_POLARS:
+                        # Mixed-type messy columns must be stringified for
+                        # the arrow conversion; nulls stay null
+                        for col in batch_df.columns:
+                            if batch_df[col].dtype == object:
+                                batch_df[col] = batch_df[col].astype(str).where(batch_df[col].notna(), None)
+
+                    if HAVE_PYARROW:
+                        table = pa.Table.from_pandas(batch_df, preserve_index=False)
+                        if writer is None:
+                            # One OSFile sink for the whole run; 64k-row
+                            # write batches keep the C++ formatter working
+                            # on large chunks regardless of our batch size
+                            sink = pa.OSFile(filename, 'wb')
+                            writer = pacsv.CSVWriter(
+                                sink, table.schema,
+                                write_options=pacsv.WriteOptions(batch_size=65536))
+                        writer.write_table(table)
+                    elif HAVE_POLARS:
+                        # pl.from_pandas needs pyarrow, which is absent on
+                        # this path; polars ingests plain numpy columns
+                        # natively (object columns are already stringified)
+                        pl.DataFrame({col: batch_df[col].to_numpy() for col in batch_df.columns}).write_csv(
+                            sink, include_header=(batch_num == 0))
+                    else:
+                        # Concat every 10 batches and write the group in one
+                        # to_csv call - fewer formatter setups than per-batch
+                        # writes, without holding the whole run in memory
+                        pending.append(batch_df)
+                        if len(pending) >= 10:
+                            pd.concat(pending, ignore_index=True, copy=False).to_csv(
+                                sink, index=False, header=(sink.tell() == 0))
+                            pending.clear()
+                    rows_written += len(batch_df)
+
+                    # No explicit cleanup: refcounting frees the previous
+                    # batch when batch_df is reassigned; a full gc.collect()
+                    # per batch walked every tracked object for nothing
+
+                    # Progress update
+                    if batch_num % 5 == 0 and batch_num > 0:
+                        elapsed = time.time() - start_time
+                        rate = rows_written / elapsed
+                        remaining_rows = self.total_rows - rows_written
+                        eta = remaining_rows / rate if rate > 0 else 0
+                        print(f"Progress: {rows_written:,}/{self.total_rows:,} ({rows_written/self.total_rows*100:.1f}%) - Rate: {rate:,.0f} rows/sec - ETA: {eta:.0f}s")
+
+            if pending:
+                pd.concat(pending, ignore_index=True, copy=False).to_csv(
+                    sink, index=False, header=(sink.tell() == 0))
+                pending.clear()
+        finally:
+            if writer is not None:
+                writer.close()
+            if sink is not None:
+                sink.close()
+
         end_time = time.time()
         total_time = end_time - start_time
         
@@ -674,11 +1018,75 @@ class MessyEcommerceGenerator:
         print(f"• Ages: 12% invalid values (negative, text, out of range)")
         print(f"• Calculations: 10% of line_totals have errors")
         print(f"• General messiness: Extra spaces, case issues, typos")
-        
+
+        return filename
+
+    def generate_parquet(self, filename='input/messy_ecommerce_1K.parquet'):
+        """Generate the complete dataset as snappy-compressed Parquet
+
+        Columnar binary output skips all CSV text formatting and is what
+        the downstream Glue/Redshift steps read natively; the categorical
+        columns arrive in arrow already dictionary-encoded.
+        """
+        if not HAVE_PYARROW:
+            raise RuntimeError("generate_parquet requires pyarrow")
+
+        print(f"\nStarting generation of {self.total_rows:,} rows of messy e-commerce data...")
+        print(f"Output file: {filename}")
+        start_time = time.time()
+
+        num_batches = (self.total_rows + self.batch_size - 1) // self.batch_size
+        batch_plan = []
+        for batch_num in range(num_batches):
+            batch_start = batch_num * self.batch_size
+            current_batch_size = min(self.batch_size, self.total_rows - batch_start)
+            if current_batch_size <= 0:
+                break
+            batch_plan.append((batch_start, current_batch_size))
+
+        # Independent, collision-free RNG streams per batch: spawn a child
+        # SeedSequence for each instead of handing out base_seed + i
+        batch_seeds = np.random.SeedSequence(42).spawn(len(batch_plan))
+
+        rows_written = 0
+        writer = None
+        max_workers = min(os.cpu_count(), len(batch_plan))
+        try:
+            with ProcessPoolExecutor(max_workers=max_workers,
+                                     initializer=_init_worker,
+                                     initargs=(self,)) as executor:
+                frames = self._batch_frames(executor, batch_plan, batch_seeds, 2 * max_workers)
+                for batch_num, batch_df in enumerate(frames):
+                    for col in batch_df.columns:
+                        if batch_df[col].dtype == object:
+                            batch_df[col] = batch_df[col].astype(str).where(batch_df[col].notna(), None)
+                    table = pa.Table.from_pandas(batch_df, preserve_index=False)
+                    if writer is None:
+                        writer = pq.ParquetWriter(filename, table.schema, compression='snappy')
+                    writer.write_table(table)
+                    rows_written += len(batch_df)
+        finally:
+            if writer is not None:
+                writer.close()
+
+        total_time = time.time() - start_time
+        print(f"\nParquet generation completed successfully!")
+        print(f"File: {filename}")
+        print(f"Total rows: {rows_written:,}")
+        print(f"Generation time: {total_time:.1f} seconds")
         return filename
 
 def main():
     """Main execution function"""
+    parser = argparse.ArgumentParser(description='Generate messy e-commerce CSV data')
+    parser.add_argument('--rows', type=int, default=1000,
+                        help='total rows to generate (default: 1000)')
+    parser.add_argument('--batch-size', type=int, default=None,
+                        help='rows per batch (default: auto-tuned from available memory)')
+    parser.add_argument('--format', choices=['csv', 'parquet'], default='csv',
+                        help='output format (parquet requires pyarrow; default: csv)')
+    args = parser.parse_args()
+
     print("=" * 60)
     print("MESSY E-COMMERCE DATA GENERATOR")
     print("=" * 60)
@@ -695,10 +1103,13 @@ def main():
     print("=" * 60)
     
     # Create generator instance
-    generator = MessyEcommerceGenerator(total_rows=1000)
+    generator = MessyEcommerceGenerator(total_rows=args.rows, batch_size=args.batch_size)
     
-    # Generate the CSV
-    output_file = generator.generate_csv('input/messy_ecommerce_1K.csv')
+    # Generate the output file
+    if args.format == 'parquet':
+        output_file = generator.generate_parquet('input/messy_ecommerce_1K.parquet')
+    else:
+        output_file = generator.generate_csv('input/messy_ecommerce_1K.csv')
     
     print(f"\nPerfect for your data pipeline project:")
     print(f"1. Upload to S3 bucket")